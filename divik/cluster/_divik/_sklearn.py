@@ -1,10 +1,10 @@
 import sys
-from functools import partial
 from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
 import tqdm
+from joblib import Parallel, delayed
 from scipy.spatial import distance as dist
 from sklearn.base import (
     BaseEstimator,
@@ -19,9 +19,9 @@ from divik.core import (
     DivikResult,
     configurable,
     context_if,
-    maybe_pool,
+    get_n_jobs,
     normalize_rows,
-    visualize,
+    save_label_image,
 )
 from divik.core.io import saver
 
@@ -431,13 +431,23 @@ class DiviK(BaseEstimator, ClusterMixin, TransformerMixin):
         check_is_fitted(self)
         if self._needs_normalization():
             X = normalize_rows(X)
-        predict = partial(_predict_path, result=self.result_)
-        with maybe_pool(self.n_jobs) as pool:
-            paths = pool.map(predict, X)
+        n_jobs = get_n_jobs(self.n_jobs)
+        if n_jobs == 1:
+            paths = [_predict_path(obs, self.result_) for obs in X]
+        else:
+            batches = np.array_split(X, n_jobs)
+            path_batches = Parallel(n_jobs=n_jobs, max_nbytes="1M")(
+                delayed(_predict_paths)(batch, self.result_) for batch in batches
+            )
+            paths = [path for batch in path_batches for path in batch]
         labels = [self.reverse_paths_[path] for path in paths]
         return np.array(labels, dtype=np.int32)
 
 
+def _predict_paths(observations: np.ndarray, result: DivikResult) -> list:
+    return [_predict_path(obs, result) for obs in observations]
+
+
 def _predict_path(observation: np.ndarray, result: DivikResult) -> Tuple[int]:
     path = []
     observation = observation[np.newaxis, :]
@@ -462,16 +472,14 @@ def make_merged(result: Optional[DivikResult]) -> np.ndarray:
 
 
 def save_merged(fname_fn, merged: np.ndarray, xy: np.ndarray = None):
-    np.savetxt(fname_fn("partitions.csv"), merged, delimiter=", ", fmt="%i")
+    pd.DataFrame(merged).to_csv(fname_fn("partitions.csv"), header=False, index=False)
     np.save(fname_fn("partitions.npy"), merged)
-    import skimage.io
 
     if xy is not None:
         for level in range(merged.shape[1]):
             np.save(fname_fn("partitions.{0}.npy".format(level)), merged[:, level])
-            visualization = visualize(merged[:, level], xy=xy)
             image_name = fname_fn("partitions.{0}.png".format(level))
-            skimage.io.imsave(image_name, visualization)
+            save_label_image(merged[:, level], xy, image_name)
 
 
 @saver
@@ -484,7 +492,10 @@ def save_divik(model, fname_fn, **kwargs):
         logging.info("Skipping DiviK details save. Cause: result is None")
         return
     logging.info("Saving DiviK partitions.")
-    merged = make_merged(model.result_).astype(np.int64)
+    from divik.core.io._model_io import _compact_int_dtype
+
+    merged = make_merged(model.result_)
+    merged = merged.astype(_compact_int_dtype(merged), copy=False)
     assert merged.shape[0] == model.result_.clustering.labels_.size
     xy = kwargs.get("xy", None)
     save_merged(fname_fn, merged, xy)
@@ -29,6 +29,55 @@ from divik.core import (
     normalize_rows,
 )
 
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    # parallel=True is off on purpose: numba threading layers leave the
+    # process unable to shut down fork-based multiprocessing.Pool workers,
+    # which are still used by GAP/Dunn scoring and histogram equalization.
+    @njit(fastmath=True, cache=True)
+    def _euclidean_argmin(data, centroids):  # pragma: no cover - needs numba
+        n_clusters, n_features = centroids.shape
+        labels = np.empty(data.shape[0], dtype=np.int64)
+        half_sq_norms = np.empty(n_clusters)
+        for j in range(n_clusters):
+            sq_norm = 0.0
+            for f in range(n_features):
+                sq_norm += centroids[j, f] * centroids[j, f]
+            half_sq_norms[j] = 0.5 * sq_norm
+        for i in range(data.shape[0]):
+            best = 0
+            # ||x - c||^2 = ||x||^2 - 2 (x.c - ||c||^2 / 2); the ||x||^2
+            # term is constant per observation, so it does not affect argmin
+            best_score = -np.inf
+            for j in range(n_clusters):
+                dot = 0.0
+                for f in range(n_features):
+                    dot += data[i, f] * centroids[j, f]
+                score = dot - half_sq_norms[j]
+                if score > best_score:
+                    best_score = score
+                    best = j
+            labels[i] = best
+        return labels
+
+
+def _can_jit_assign(data, centroids, distance_metric):
+    return (
+        _HAS_NUMBA
+        and distance_metric == "euclidean"
+        and isinstance(data, np.ndarray)
+        and np.issubdtype(data.dtype, np.floating)
+        and np.issubdtype(centroids.dtype, np.floating)
+    )
+
 
 class Labeling(object):
     """Labels observations by closest centroids"""
@@ -56,7 +105,18 @@ class Labeling(object):
             logging.error(msg)
             raise ValueError(msg)
 
-        if self.allow_dask and (data.shape[0] > 10000 or data.shape[1] > 1000):
+        if centroids.shape[0] == 0:
+            msg = "At least one centroid is required for labeling."
+            logging.error(msg)
+            raise ValueError(msg)
+
+        if _can_jit_assign(data, centroids, self.distance_metric):
+            # Fused distance + argmin; never materializes the full
+            # observations x centroids distance matrix.
+            labels = _euclidean_argmin(
+                np.ascontiguousarray(data), np.ascontiguousarray(centroids)
+            )
+        elif self.allow_dask and (data.shape[0] > 10000 or data.shape[1] > 1000):
             X1 = da.from_array(data)
             X2 = da.from_array(centroids)
             distances = ddst.cdist(X1, X2, self.distance_metric)
@@ -1,10 +1,9 @@
 import logging
 import sys
-import uuid
-from functools import partial
 
 import numpy as np
 import tqdm
+from joblib import Parallel, delayed
 from sklearn.base import (
     BaseEstimator,
     ClusterMixin,
@@ -13,21 +12,11 @@ from sklearn.base import (
 )
 from sklearn.utils.validation import check_is_fitted
 
-from divik.core import (
-    configurable,
-    maybe_pool,
-    share,
-)
+from divik.core import configurable
 from divik.score import dunn, sampled_dunn
 
 from ._core import KMeans
 
-_DATA = {}
-
-
-def _pool_initialize(ref, data):
-    _DATA[ref] = data
-
 
 @configurable
 class DunnSearch(BaseEstimator, ClusterMixin, TransformerMixin):
@@ -36,7 +25,10 @@ class DunnSearch(BaseEstimator, ClusterMixin, TransformerMixin):
     Parameters
     ----------
     kmeans : KMeans
-        KMeans object to tune
+        KMeans object to tune. Any centroid-based estimator exposing
+        ``n_clusters``, ``labels_`` and ``cluster_centers_`` works, e.g.
+        ``sklearn.cluster.MiniBatchKMeans`` to trade a bit of precision
+        for much less computations on large numbers of observations.
 
     max_clusters: int
         The maximal number of clusters to form and score.
@@ -175,8 +167,7 @@ class DunnSearch(BaseEstimator, ClusterMixin, TransformerMixin):
             raise ValueError(f"Unknown Dunn method {self.method}")
         return dunn_(kmeans, data, inter=self.inter, intra=self.intra)
 
-    def _fit_kmeans(self, n_clusters, data_ref):
-        data = _DATA[data_ref].value
+    def _fit_kmeans(self, n_clusters, data):
         kmeans = clone(self.kmeans)
         kmeans.n_clusters = n_clusters
         kmeans.fit(data)
@@ -201,15 +192,9 @@ class DunnSearch(BaseEstimator, ClusterMixin, TransformerMixin):
         n_clusters = range(self.min_clusters, self.max_clusters + 1)
         if self.verbose:
             n_clusters = tqdm.tqdm(n_clusters, leave=False, file=sys.stdout)
-        ref = str(uuid.uuid4())
-        with share(X) as x:
-            _DATA[ref] = x
-            with maybe_pool(
-                self.n_jobs, initializer=_pool_initialize, initargs=(ref, x)
-            ) as pool:
-                fit_kmeans = partial(self._fit_kmeans, data_ref=ref)
-                kmeans_and_scores = pool.map(fit_kmeans, n_clusters)
-            del _DATA[ref]
+        kmeans_and_scores = Parallel(n_jobs=self.n_jobs, max_nbytes="1M")(
+            delayed(self._fit_kmeans)(n, X) for n in n_clusters
+        )
         logging.debug("Fitted DunnSearch")
 
         self.estimators_, self.scores_ = zip(*kmeans_and_scores)
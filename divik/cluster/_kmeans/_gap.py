@@ -27,7 +27,10 @@ class GAPSearch(BaseEstimator, ClusterMixin, TransformerMixin):
     Parameters
     ----------
     kmeans : KMeans
-        KMeans object to tune
+        KMeans object to tune. Any centroid-based estimator exposing
+        ``n_clusters``, ``labels_`` and ``cluster_centers_`` works, e.g.
+        ``sklearn.cluster.MiniBatchKMeans`` to trade a bit of precision
+        for much less computations on large numbers of observations.
 
     max_clusters: int
         The maximal number of clusters to form and score.
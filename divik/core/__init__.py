@@ -24,6 +24,7 @@ from ._utils import (
     build,
     context_if,
     normalize_rows,
+    save_label_image,
     visualize,
 )
 
@@ -37,6 +38,7 @@ __all__ = [
     "build",
     "context_if",
     "normalize_rows",
+    "save_label_image",
     "visualize",
     "get_n_jobs",
     "maybe_pool",
@@ -1,4 +1,5 @@
 """multiprocessing.Pool helpers"""
+import atexit
 import ctypes
 import os
 import uuid
@@ -155,6 +156,18 @@ class DummyPool:
         return [func(*v) for v in iterable]
 
 
+_SHARED_POOLS = {}
+
+
+def _shared_pool(n_jobs):
+    """Get a reusable worker pool, sparing the fork cost on repeated entry"""
+    if n_jobs not in _SHARED_POOLS:
+        pool = Pool(n_jobs)
+        atexit.register(pool.terminate)
+        _SHARED_POOLS[n_jobs] = pool
+    return _SHARED_POOLS[n_jobs]
+
+
 @contextmanager
 def maybe_pool(processes: int = None, *args, **kwargs):
     """Create ``multiprocessing.Pool`` if multiple CPUs are allowed
@@ -173,6 +186,10 @@ def maybe_pool(processes: int = None, *args, **kwargs):
     n_jobs = get_n_jobs(processes)
     if n_jobs == 1 or n_jobs == 0:
         yield DummyPool(n_jobs, *args, **kwargs)
-    else:
+    elif args or kwargs:
+        # Initializers may rely on state set up right before the fork
+        # (e.g. shared arrays), so such pools cannot be reused.
         with Pool(n_jobs, *args, **kwargs) as pool:
             yield pool
+    else:
+        yield _shared_pool(n_jobs)
@@ -1,5 +1,6 @@
 import inspect
 import logging
+import math
 import os
 import sys
 import time
@@ -16,17 +17,49 @@ from skimage.color import label2rgb
 from .. import __version__
 from ._types import Data
 
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    # parallel=True is off on purpose: numba threading layers leave the
+    # process unable to shut down fork-based multiprocessing.Pool workers,
+    # which are still used by GAP/Dunn scoring and histogram equalization.
+    @njit(fastmath=True, cache=True)
+    def _normalize_rows(data, out):  # pragma: no cover - needs numba
+        for i in range(data.shape[0]):
+            mean = 0.0
+            for j in range(data.shape[1]):
+                mean += data[i, j]
+            mean /= data.shape[1]
+            norm = 0.0
+            for j in range(data.shape[1]):
+                value = data[i, j] - mean
+                out[i, j] = value
+                norm += value * value
+            inv_norm = 1.0 / math.sqrt(norm)
+            for j in range(data.shape[1]):
+                out[i, j] *= inv_norm
+
 
 def normalize_rows(data: Data) -> Data:
     """Translate and scale rows to zero mean and vector length equal one"""
-    normalized = data - data.mean(axis=1)[:, np.newaxis]
-    norms = np.sum(np.abs(normalized) ** 2, axis=-1, keepdims=True) ** (1.0 / 2)
-    normalized /= norms
+    if _HAS_NUMBA and data.ndim == 2 and np.issubdtype(data.dtype, np.floating):
+        normalized = np.empty_like(data)
+        _normalize_rows(data, normalized)
+        return normalized
+    normalized = data - data.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(normalized, axis=1, keepdims=True)
+    np.divide(normalized, norms, out=normalized)
     return normalized
 
 
-def visualize(label, xy, shape=None):
-    """Create RGB map of labels over with given coordinates"""
+def _label_map(label, xy, shape=None):
     x, y = xy.T
     if shape is None:
         shape = np.max(y) + 1, np.max(x) + 1
@@ -34,10 +67,48 @@ def visualize(label, xy, shape=None):
     label = label - label.min() + 1
     label_map = np.zeros(shape, dtype=int)
     label_map[y, x] = label
+    return label_map
+
+
+def visualize(label, xy, shape=None):
+    """Create RGB map of labels over with given coordinates"""
+    label_map = _label_map(label, xy, shape)
     image = label2rgb(label_map, bg_label=0)
     return image
 
 
+_PALETTE = None
+
+
+def _indexed_palette():
+    global _PALETTE
+    if _PALETTE is None:
+        levels = np.arange(256).reshape(-1, 1)
+        colors = label2rgb(levels, bg_label=0)
+        _PALETTE = np.round(255 * colors).astype(np.uint8).ravel().tolist()
+    return _PALETTE
+
+
+def save_label_image(label, xy, path, shape=None):
+    """Save map of labels over given coordinates as a PNG file
+
+    For up to 256 distinct levels the image is written as an indexed PNG
+    straight from the label map, which avoids materializing a full float
+    RGB image just to encode it back to 8-bit.
+    """
+    label_map = _label_map(label, xy, shape)
+    if label_map.max() > 255:
+        import skimage.io
+
+        skimage.io.imsave(path, label2rgb(label_map, bg_label=0))
+        return
+    from PIL import Image
+
+    image = Image.fromarray(label_map.astype(np.uint8), mode="P")
+    image.putpalette(_indexed_palette())
+    image.save(path)
+
+
 @contextmanager
 def context_if(condition, context, *args, **kwargs):
     """Create context with given params only if the condition is ``True``"""
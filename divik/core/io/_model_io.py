@@ -4,11 +4,12 @@ import os
 import pickle
 from functools import partial
 
+import joblib
 import numpy as np
 import pandas as pd
 from sklearn.pipeline import Pipeline
 
-from divik.core import configurable, visualize
+from divik.core import configurable, save_label_image
 
 _SAVERS = set()
 
@@ -48,12 +49,23 @@ def saver(fn):
     _SAVERS.add(fn)
 
 
+def _compact_int_dtype(labels):
+    """Find the smallest integer dtype able to represent all the labels"""
+    return np.promote_types(
+        np.min_scalar_type(int(labels.min())), np.min_scalar_type(int(labels.max()))
+    )
+
+
 def save(model, destination, **kwargs):
     """Save model and related summaries into specified destination directory"""
     if isinstance(destination, partial):
         fname_fn = destination
     else:
         fname_fn = partial(os.path.join, destination)
+    if _has_partitions(model) and "partitions" not in kwargs:
+        # The partitions matrix is the largest artifact; build it once and
+        # let every saver reuse it.
+        kwargs["partitions"] = _partitions_matrix(model)
     for save_fn in _SAVERS:
         save_fn(model, fname_fn, **kwargs)
 
@@ -64,8 +76,7 @@ def save_pickle(model, fname_fn, enabled=True, **kwargs):
     if not enabled:
         return
     logging.info("Saving model pickle.")
-    with open(fname_fn("model.pkl"), "wb") as pkl:
-        pickle.dump(model, pkl)
+    joblib.dump(model, fname_fn("model.pkl"), compress=3, protocol=pickle.HIGHEST_PROTOCOL)
 
 
 @saver
@@ -86,58 +97,146 @@ def save_summary(model, fname_fn, **kwargs):
 
 
 @saver
-def save_labels(model, fname_fn, **kwargs):
+@configurable(allowlist=["enabled"])
+def save_labels(model, fname_fn, enabled=False, **kwargs):
+    """Dump final partition as loose ``.npy``/``.csv`` files
+
+    Legacy format: the same array lands compressed in ``arrays.npz`` by
+    default, so the loose dumps are opt-in. The image is always saved.
+    """
     if not hasattr(model, "labels_"):
         return
-    logging.info("Saving final partition.")
-    np.save(fname_fn("final_partition.npy"), model.labels_)
-    np.savetxt(fname_fn("final_partition.csv"), model.labels_, delimiter=", ", fmt="%i")
     if "xy" in kwargs:
-        import skimage.io
+        save_label_image(
+            model.labels_, kwargs["xy"], fname_fn("final_partition.png")
+        )
+    if not enabled:
+        return
+    logging.info("Saving final partition.")
+    labels = model.labels_.astype(_compact_int_dtype(model.labels_), copy=False)
+    np.save(fname_fn("final_partition.npy"), labels)
+    with open(
+        fname_fn("final_partition.csv"), "w", buffering=1 << 20, newline=""
+    ) as csv:
+        pd.DataFrame(labels).to_csv(csv, header=False, index=False)
+
+
+def _has_partitions(model):
+    return (
+        getattr(model, "estimators_", None) is not None
+        and hasattr(model.estimators_[0], "labels_")
+    )
 
-        visualization = visualize(model.labels_, xy=kwargs["xy"])
-        skimage.io.imsave(fname_fn("final_partition.png"), visualization)
+
+def _partitions_matrix(model):
+    estimators = model.estimators_
+    bounds = np.array([[e.labels_.min(), e.labels_.max()] for e in estimators])
+    # Preallocated column-major target: the consumers read it column by
+    # column, and there is no wide platform-int intermediate to downcast.
+    part = np.empty(
+        (estimators[0].labels_.shape[0], len(estimators)),
+        dtype=_compact_int_dtype(bounds),
+        order="F",
+    )
+    for i, estimator in enumerate(estimators):
+        part[:, i] = estimator.labels_
+    return part
 
 
 @saver
-def save_multiple_labels(model, fname_fn, **kwargs):
-    if not hasattr(model, "estimators_") or not hasattr(model.estimators[0], "labels_"):
+@configurable(allowlist=["enabled"])
+def save_multiple_labels(model, fname_fn, enabled=False, **kwargs):
+    """Dump considered partitions as loose ``.npy``/``.csv`` files
+
+    Legacy format: the same matrix lands compressed in ``arrays.npz`` by
+    default, so the loose dumps are opt-in. The images are always saved.
+    """
+    if not _has_partitions(model):
+        return
+    part = kwargs.get("partitions")
+    if part is None:
+        part = _partitions_matrix(model)
+    if "xy" in kwargs:
+        for i in range(part.shape[1]):
+            save_label_image(
+                part[:, i], kwargs["xy"], fname_fn("partitions.{0}.png").format(i)
+            )
+    if not enabled:
         return
     logging.info("Saving all considered partitions.")
-    part = np.hstack([e.labels_.reshape(-1, 1) for e in model.estimators_])
     np.save(fname_fn("partitions.npy"), part)
-    np.savetxt(fname_fn("partitions.csv"), part, delimiter=", ", fmt="%i")
-
-    import skimage.io
+    with open(fname_fn("partitions.csv"), "w", buffering=1 << 20, newline="") as csv:
+        pd.DataFrame(part).to_csv(csv, header=False, index=False)
 
+    # Format all the labels in one vectorized pass; per-k files are just
+    # column slices of the formatted matrix.
+    text = np.char.mod("%i", part).astype("S")
     for i in range(part.shape[1]):
-        np.savetxt(
-            fname_fn("partitions.{0}.csv").format(i),
-            part[:, i].reshape(-1, 1),
-            delimiter=", ",
-            fmt="%i",
+        with open(fname_fn("partitions.{0}.csv").format(i), "wb") as csv:
+            csv.write(b"\n".join(text[:, i]) + b"\n")
+
+
+@saver
+@configurable(allowlist=["enabled"])
+def save_compressed_arrays(model, fname_fn, enabled=True, **kwargs):
+    """Bundle all the persisted arrays into one compressed archive
+
+    Label arrays have a tiny alphabet, so they deflate very well, and a
+    single archive replaces a handful of per-array writes.
+    """
+    if not enabled:
+        return
+    arrays = {}
+    if hasattr(model, "labels_"):
+        arrays["final_partition"] = model.labels_.astype(
+            _compact_int_dtype(model.labels_), copy=False
         )
-        if "xy" in kwargs:
-            visualization = visualize(part, xy=kwargs["xy"])
-            skimage.io.imsave(fname_fn("partitions.{0}.png").format(i), visualization)
+    if _has_partitions(model):
+        part = kwargs.get("partitions")
+        if part is None:
+            part = _partitions_matrix(model)
+        arrays["partitions"] = part
+    if hasattr(model, "centroids_"):
+        arrays["centroids"] = model.centroids_.astype(np.float32, copy=False)
+    if hasattr(model, "filters_"):
+        arrays["filters"] = model.filters_
+    if not arrays:
+        return
+    logging.info("Saving compressed arrays archive.")
+    np.savez_compressed(fname_fn("arrays.npz"), **arrays)
 
 
 @saver
-def save_centroids(model, fname_fn, **kwargs):
-    if not hasattr(model, "centroids_"):
+@configurable(allowlist=["enabled"])
+def save_centroids(model, fname_fn, enabled=False, **kwargs):
+    """Dump centroids as loose ``.npy``/``.csv`` files
+
+    Legacy format: the same array lands compressed in ``arrays.npz`` by
+    default, so the loose dumps are opt-in.
+    """
+    if not enabled or not hasattr(model, "centroids_"):
         return
     logging.info("Saving centroids.")
-    np.save(fname_fn("centroids.npy"), model.centroids_)
-    np.savetxt(fname_fn("centroids.csv"), model.centroids_, delimiter=", ")
+    centroids = model.centroids_.astype(np.float32, copy=False)
+    np.save(fname_fn("centroids.npy"), centroids)
+    with open(fname_fn("centroids.csv"), "w", buffering=1 << 20) as csv:
+        np.savetxt(csv, centroids, delimiter=", ")
 
 
 @saver
-def save_filters(model, fname_fn, **kwargs):
-    if not hasattr(model, "filters_"):
+@configurable(allowlist=["enabled"])
+def save_filters(model, fname_fn, enabled=False, **kwargs):
+    """Dump filters as loose ``.npy``/``.csv`` files
+
+    Legacy format: the same array lands compressed in ``arrays.npz`` by
+    default, so the loose dumps are opt-in.
+    """
+    if not enabled or not hasattr(model, "filters_"):
         return
     logging.info("Saving filters.")
     np.save(fname_fn("filters.npy"), model.filters_)
-    np.savetxt(fname_fn("filters.csv"), model.filters_, delimiter=", ", fmt="%i")
+    with open(fname_fn("filters.csv"), "w", buffering=1 << 20) as csv:
+        np.savetxt(csv, model.filters_, delimiter=", ", fmt="%i")
 
 
 @saver
@@ -158,10 +257,15 @@ def save_pipeline(model, fname_fn, **kwargs):
     clustering = model[-1]
     if isinstance(clustering, Pipeline):
         logging.info("Saving pre-extractor pickle.")
-        with open(fname_fn("feature_pre_extractor.pkl"), "wb") as pkl:
-            pickle.dump(feature_selector, pkl)
+        joblib.dump(
+            feature_selector,
+            fname_fn("feature_pre_extractor.pkl"),
+            compress=3,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
         return save(clustering, fname_fn, **kwargs)
     logging.info("Saving model pickle.")
-    with open(fname_fn("feature_selector.pkl"), "wb") as pkl:
-        pickle.dump(feature_selector, pkl)
+    joblib.dump(
+        feature_selector, fname_fn("feature_selector.pkl"), compress=3, protocol=pickle.HIGHEST_PROTOCOL
+    )
     save(clustering, fname_fn, **kwargs)
@@ -166,11 +166,14 @@ class LocallyAdjustedRbfSpectralEmbedding(BaseEstimator):
         import pickle
         from functools import partial
 
+        import joblib
+
         fname = partial(os.path.join, destination)
 
         logging.debug("Saving model.")
-        with open(fname("model.pkl"), "wb") as pkl:
-            pickle.dump(self, pkl)
+        joblib.dump(
+            self, fname("model.pkl"), compress=3, protocol=pickle.HIGHEST_PROTOCOL
+        )
 
         logging.debug("Saving embedding.")
         save_csv(self.embedding_, fname("embedding.csv"))
@@ -63,6 +63,12 @@ class GMMSelector(BaseEstimator, StatSelectorMixin):
     max_components: int, optional, default: 10
         The maximum number of components used in the GMM decomposition.
 
+    precomputed_stat: array, optional, default: None
+        Feature characteristic computed upfront, e.g. shared between multiple
+        selectors working on the same data. When provided, the selector skips
+        its own pass over the data. Must match ``stat`` and the number of
+        features in the data.
+
     Attributes
     ----------
     vals_: array, shape (n_features,)
@@ -102,6 +108,7 @@ class GMMSelector(BaseEstimator, StatSelectorMixin):
         min_features_rate: float = 0.0,
         preserve_high: bool = True,
         max_components: int = 10,
+        precomputed_stat: np.ndarray = None,
     ):
         if stat not in {"cv", "mean", "var"} and not callable(stat):
             msg = 'stat must be one of {"cv", "mean", "var"} or callable'
@@ -115,6 +122,7 @@ class GMMSelector(BaseEstimator, StatSelectorMixin):
         self.min_features_rate = min_features_rate
         self.preserve_high = preserve_high
         self.max_components = max_components
+        self.precomputed_stat = precomputed_stat
 
     def fit(self, X, y=None):
         """Learn data-driven feature thresholds from X.
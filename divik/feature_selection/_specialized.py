@@ -6,7 +6,7 @@ from divik.core import build, configurable
 from ._gmm_selector import GMMSelector
 from ._outlier import OutlierSelector
 from ._percentage_selector import PercentageSelector
-from ._stat_selector_mixin import NoSelector, SelectorMixin
+from ._stat_selector_mixin import NoSelector, SelectorMixin, column_stats
 
 
 @configurable
@@ -105,6 +105,10 @@ class HighAbundanceAndVarianceSelector(BaseEstimator, SelectorMixin):
             self.selected_ = np.ones((X.shape[1],), dtype=bool)
             return self
 
+        # Single fused pass over X yields both characteristics the selectors
+        # need, instead of one reduction per selector.
+        mean, var = column_stats(X)
+
         self.abundance_selector_ = GMMSelector(
             "mean",
             use_log=self.use_log,
@@ -112,9 +116,13 @@ class HighAbundanceAndVarianceSelector(BaseEstimator, SelectorMixin):
             min_features=min_features,
             preserve_high=True,
             max_components=self.max_components,
+            precomputed_stat=mean,
         ).fit(X)
-        filtered = self.abundance_selector_.transform(X)
-        self.selected_ = self.abundance_selector_.selected_.copy()
+        abundant = self.abundance_selector_.selected_
+        # The variance selector works entirely from the precomputed
+        # variances, so a zero-row view stands in for the filtered matrix
+        # and the n_samples x n_survivors copy is never materialized.
+        filtered = X[:0, abundant]
 
         self.variance_selector_ = GMMSelector(
             "var",
@@ -123,8 +131,11 @@ class HighAbundanceAndVarianceSelector(BaseEstimator, SelectorMixin):
             min_features=min_features,
             preserve_high=True,
             max_components=self.max_components,
+            precomputed_stat=var[abundant],
         ).fit(filtered)
-        self.selected_[self.selected_] = self.variance_selector_.selected_
+        selected = np.zeros_like(abundant)
+        selected[np.flatnonzero(abundant)] = self.variance_selector_.selected_
+        self.selected_ = selected
 
         return self
 
@@ -173,8 +184,9 @@ class OutlierAbundanceAndVarianceSelector(BaseEstimator, SelectorMixin):
         self.abundance_selector_, a_selected = self._fit_abundance(X)
         filtered = X[:, a_selected]
         self.variance_selector_, v_selected = self._fit_variance(filtered, a_selected)
-        self.selected_ = a_selected
-        self.selected_[a_selected] = v_selected
+        selected = np.zeros_like(a_selected)
+        selected[np.flatnonzero(a_selected)] = v_selected
+        self.selected_ = selected
         return self
 
     def _fit_abundance(self, X):
@@ -2,15 +2,78 @@ import logging
 from abc import ABCMeta
 
 import numpy as np
+from scipy import sparse
 from sklearn.base import BaseEstimator
 
 try:
+    from sklearn.feature_selection import SelectorMixin
+except ImportError:
     from sklearn.feature_selection._base import SelectorMixin
-except ModuleNotFoundError:
-    from sklearn.feature_selection.base import SelectorMixin
 
 from divik.core import configurable
 
+try:
+    from numba import njit
+
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+if _HAS_NUMBA:
+
+    # parallel=True is off on purpose: numba threading layers leave the
+    # process unable to shut down fork-based multiprocessing.Pool workers,
+    # which are still used by GAP/Dunn scoring and histogram equalization.
+    @njit(fastmath=True, cache=True)
+    def _column_sums(X):  # pragma: no cover - needs numba
+        n, m = X.shape
+        s = np.zeros(m)
+        s2 = np.zeros(m)
+        for j in range(m):
+            # Accumulate deviations from the first row instead of raw
+            # values - the uncentered sums cancel away the variance for
+            # columns with a large offset.
+            shift = X[0, j]
+            sum_ = 0.0
+            sum_sq = 0.0
+            for i in range(n):
+                value = X[i, j] - shift
+                sum_ += value
+                sum_sq += value * value
+            s[j] = sum_
+            s2[j] = sum_sq
+        return s, s2
+
+
+def column_stats(X):
+    """Compute column means and variances of ``X``
+
+    Accumulates in float64 regardless of the input dtype, so float32 data
+    does not lose precision, and deviations are taken against a per-column
+    shift, so large offsets do not cancel the variance away. Supports both
+    dense arrays and sparse matrices without densification.
+    """
+    n = X.shape[0]
+    if sparse.issparse(X):
+        # Shifting a sparse matrix would densify it, so the uncentered
+        # sums stay; sparse columns are zero-dominated, which keeps the
+        # cancellation benign, and clamping removes negative round-off.
+        mean = np.asarray(X.mean(axis=0, dtype=np.float64)).ravel()
+        s2 = np.asarray(X.multiply(X).sum(axis=0, dtype=np.float64)).ravel()
+        var = s2 / n - mean * mean
+    elif _HAS_NUMBA and np.issubdtype(np.asarray(X).dtype, np.floating):
+        X = np.asarray(X)
+        s, s2 = _column_sums(X)
+        shifted_mean = s / n
+        mean = X[0].astype(np.float64) + shifted_mean
+        var = s2 / n - shifted_mean * shifted_mean
+    else:
+        X = np.asarray(X)
+        mean = X.mean(axis=0, dtype=np.float64)
+        var = np.var(X, axis=0, dtype=np.float64)
+    return mean, np.maximum(var, 0)
+
 
 class StatSelectorMixin(SelectorMixin, metaclass=ABCMeta):
     """
@@ -24,8 +87,35 @@ class StatSelectorMixin(SelectorMixin, metaclass=ABCMeta):
     given ``stat``, optionally ``use_log`` and ``preserve_high``.
     """
 
+    def transform(self, X):
+        """Reduce X to the selected features
+
+        Sparse matrices keep their format: columns are picked directly on
+        the sparse container instead of densifying it first.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix}, shape (n_samples, n_features)
+            Sample vectors to transform.
+
+        Returns
+        -------
+        X_r : {array-like, sparse matrix} of selected features
+        """
+        if sparse.issparse(X):
+            return X[:, np.flatnonzero(self._get_support_mask())]
+        return super().transform(X)
+
     def _to_characteristics(self, X):
         """Extract & normalize characteristics from data"""
+        precomputed = getattr(self, "precomputed_stat", None)
+        if precomputed is not None:
+            vals = np.asarray(precomputed)
+            if vals.size != X.shape[1]:
+                raise RuntimeError(
+                    "Precomputed statistic shape mismatch {0}".format(vals.shape)
+                )
+            return self._normalize_characteristics(vals)
         try:
             neutral = self.neutral
         except AttributeError:
@@ -33,7 +123,15 @@ class StatSelectorMixin(SelectorMixin, metaclass=ABCMeta):
         if neutral is not None:
             X = X.copy()
             X[X == neutral] = np.nan
-        if self.stat == "mean":
+        if self.stat in ("mean", "var", "cv") and neutral is None:
+            mean, var = column_stats(X)
+            if self.stat == "mean":
+                vals = mean
+            elif self.stat == "var":
+                vals = var
+            else:
+                vals = np.sqrt(var) / mean
+        elif self.stat == "mean":
             vals = np.nanmean(X, axis=0)
         elif self.stat == "var":
             vals = np.nanvar(X, axis=0)
@@ -50,6 +148,10 @@ class StatSelectorMixin(SelectorMixin, metaclass=ABCMeta):
             logging.error(msg)
             raise ValueError(msg)
 
+        return self._normalize_characteristics(vals)
+
+    def _normalize_characteristics(self, vals):
+        """Apply log-scaling and orientation to raw characteristics"""
         if hasattr(self, "use_log") and self.use_log:
             if np.any(vals < 0):
                 logging.error(
@@ -73,8 +73,8 @@ class UniformSampler(BaseSampler):
         sample : array_like, (*self.shape_)
             Returns the drawn sample
         """
-        with seed_(seed):
-            unscaled = np.random.random_sample(self.shape_)
+        with seed_(seed) as rng:
+            unscaled = rng.random(self.shape_)
         return self.scaler_.inverse_transform(unscaled)
 
 
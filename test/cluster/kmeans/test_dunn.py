@@ -1,6 +1,7 @@
 import unittest
 
 from parameterized import parameterized
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.datasets import make_blobs
 from sklearn.metrics import adjusted_rand_score
 
@@ -61,6 +62,15 @@ class DunnSearchTest(unittest.TestCase):
         assert n_clusters == kmeans.n_clusters_
         assert rand > 0.75
 
+    def test_works_with_minibatch_kmeans(self):
+        n_clusters = 3
+        X, y = data(n_clusters)
+        minibatch = MiniBatchKMeans(n_clusters=2, n_init=3, random_state=42)
+        kmeans = DunnSearch(minibatch, max_clusters=10).fit(X)
+        rand = adjusted_rand_score(y, kmeans.labels_)
+        assert n_clusters == kmeans.n_clusters_
+        assert rand > 0.75
+
     def test_works_with_unfit_removal(self):
         n_clusters = 3
         X, y = data(n_clusters)
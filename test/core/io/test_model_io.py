@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+from PIL import Image
+
+from divik.core import save_label_image
+from divik.core.io import save
+from divik.core.io._model_io import _compact_int_dtype
+
+
+class DummyKMeans:
+    def __init__(self, labels):
+        self.labels_ = np.asarray(labels)
+
+
+class DummyModel:
+    def __init__(self):
+        self.labels_ = np.array([0, 0, 1, 1, 2, 2])
+        self.centroids_ = np.arange(18, dtype=np.float64).reshape(3, 6)
+        self.filters_ = np.ones((3, 6), dtype=bool)
+        self.estimators_ = [
+            DummyKMeans([0, 0, 0, 1, 1, 1]),
+            DummyKMeans([0, 0, 1, 1, 2, 2]),
+        ]
+
+
+class CompactIntDtypeTest(unittest.TestCase):
+    def test_selects_smallest_sufficient_dtype(self):
+        assert _compact_int_dtype(np.array([0, 3, 255])) == np.uint8
+        assert _compact_int_dtype(np.array([0, 70000])) == np.uint32
+
+    def test_preserves_values_including_negative(self):
+        labels = np.array([-1, 0, 5, 1000])
+        dtype = _compact_int_dtype(labels)
+        npt.assert_array_equal(labels.astype(dtype), labels)
+        assert dtype.itemsize < labels.dtype.itemsize
+
+
+class SaveCompressedArraysTest(unittest.TestCase):
+    def test_bundles_all_arrays_into_one_archive(self):
+        model = DummyModel()
+        with tempfile.TemporaryDirectory() as destination:
+            save(model, destination)
+            with np.load(os.path.join(destination, "arrays.npz")) as arrays:
+                npt.assert_array_equal(arrays["final_partition"], model.labels_)
+                npt.assert_array_equal(
+                    arrays["partitions"],
+                    np.hstack([e.labels_.reshape(-1, 1) for e in model.estimators_]),
+                )
+                npt.assert_array_equal(arrays["centroids"], model.centroids_)
+                assert arrays["centroids"].dtype == np.float32
+                npt.assert_array_equal(arrays["filters"], model.filters_)
+
+    def test_skips_models_without_arrays(self):
+        with tempfile.TemporaryDirectory() as destination:
+            save(object(), destination)
+            assert not os.path.exists(os.path.join(destination, "arrays.npz"))
+
+    def test_default_save_does_not_duplicate_loose_arrays(self):
+        model = DummyModel()
+        with tempfile.TemporaryDirectory() as destination:
+            save(model, destination)
+            assert os.path.exists(os.path.join(destination, "arrays.npz"))
+            assert not os.path.exists(
+                os.path.join(destination, "final_partition.npy")
+            )
+            assert not os.path.exists(os.path.join(destination, "partitions.npy"))
+            assert not os.path.exists(os.path.join(destination, "centroids.npy"))
+            assert not os.path.exists(os.path.join(destination, "filters.npy"))
+
+
+class SaveLabelImageTest(unittest.TestCase):
+    def test_saves_indexed_png_with_one_color_per_label(self):
+        label = np.array([0, 0, 1, 1, 2, 2])
+        xy = np.array([[x, y] for y in range(2) for x in range(3)])
+        with tempfile.TemporaryDirectory() as destination:
+            path = os.path.join(destination, "labels.png")
+            save_label_image(label, xy, path)
+            with Image.open(path) as image:
+                assert image.mode == "P"
+                assert image.size == (3, 2)
+                indexed = np.asarray(image)
+        assert np.unique(indexed).size == np.unique(label).size
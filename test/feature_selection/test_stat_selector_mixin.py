@@ -0,0 +1,41 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+from scipy import sparse
+
+from divik.feature_selection._stat_selector_mixin import column_stats
+
+
+class ColumnStatsTest(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+
+    def test_matches_numpy_mean_and_var(self):
+        data = np.random.randn(100, 5)
+        mean, var = column_stats(data)
+        npt.assert_allclose(mean, data.mean(axis=0))
+        npt.assert_allclose(var, data.var(axis=0))
+
+    def test_is_robust_to_large_offset_in_float32(self):
+        data = (1e6 + 3 * np.random.randn(10000, 3)).astype(np.float32)
+        data[:, 0] = 1e6
+        mean, var = column_stats(data)
+        npt.assert_allclose(mean, data.mean(axis=0, dtype=np.float64))
+        assert var[0] == 0.0
+        npt.assert_allclose(
+            var[1:], data.var(axis=0, dtype=np.float64)[1:], rtol=1e-6
+        )
+
+    def test_never_returns_negative_variance(self):
+        data = np.full((1000, 4), 1e8, dtype=np.float32)
+        _, var = column_stats(data)
+        assert np.all(var >= 0)
+
+    def test_supports_sparse_matrices(self):
+        data = sparse.random(100, 8, density=0.3, random_state=42, format="csr")
+        mean, var = column_stats(data)
+        dense = data.toarray()
+        npt.assert_allclose(mean, dense.mean(axis=0))
+        npt.assert_allclose(var, dense.var(axis=0), atol=1e-12)
+        assert np.all(var >= 0)